@@ -94,7 +94,9 @@ Your job:
 
 Rules:
 - Always use write_file to create code — never bash heredocs for long scripts
-- Include error handling, rate limiting, and clear CLI arguments
+- Include error handling, rate limiting, and clear CLI arguments — on 429s, honor Retry-After and back off exponentially
+- For scrapers that make many requests, reuse one HTTP session and fetch concurrently with a bounded limit (asyncio + semaphore or a thread pool) instead of a serial loop
+- Skip per-item detail requests when the listing or search response already contains every field you need
 - Add a docstring at the top explaining what the script does and how to run it
 - If writing a scraper, base selectors on actual page structure (from reference data), not guesses
 - Be concise in your return — just the file path and what the script does`,